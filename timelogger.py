@@ -6,46 +6,140 @@ Configurable lunch break duration.
 Enhanced with 35-hour weekly rule exception.
 """
 
+import bisect
 import datetime
+import functools
 import os
+import re
+import sys
 import json
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library
+    orjson = None
+
+TARGET_DAILY_MIN = 7 * 60
+TARGET_WEEKLY_MIN = 35 * 60
+# Weekly worked time after which the 35-hour target is shown
+SHOW_WEEKLY_TARGET_MIN = 27 * 60
+
+_WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+_HHMM_RE = re.compile(r'([01]?\d|2[0-3]):([0-5]?\d)')
+
+
+def _parse_hhmm(time_str: str) -> Tuple[int, int]:
+    """Parse a stored HH:MM string into (hour, minute)."""
+    hour, minute = time_str.split(':')
+    return int(hour), int(minute)
+
+
+@functools.lru_cache(maxsize=256)
+def _valid_hhmm(time_str: str) -> Optional[Tuple[int, int]]:
+    """Validate a user-entered HH:MM string, returning (hour, minute) or None."""
+    match = _HHMM_RE.fullmatch(time_str)
+    return (int(match[1]), int(match[2])) if match else None
+
+
+def _parse_date(date_str: str) -> datetime.date:
+    """Parse a stored YYYY-MM-DD string into a date."""
+    year, month, day = date_str.split('-')
+    return datetime.date(int(year), int(month), int(day))
+
+
+def _combine(date: datetime.date, time_str: str) -> datetime.datetime:
+    """Build a datetime from a date and a stored HH:MM string."""
+    hour, minute = _parse_hhmm(time_str)
+    return datetime.datetime(date.year, date.month, date.day, hour, minute)
+
 class WorkLogger:
     def __init__(self, data_file: str = "work_log.json"):
         self.data_file = data_file
+        self._dirty = False
         self.load_data()
     
     def load_data(self):
         """Load existing work log data from file."""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, 'r') as f:
-                    self.data = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                self.data = {}
-        else:
+        try:
+            # Read the whole file in one go rather than stat-ing it first
+            with open(self.data_file, 'rb', buffering=0) as f:
+                buf = f.read()
+            if orjson is not None:
+                self.data = orjson.loads(buf)
+            else:
+                self.data = json.loads(buf)
+        except (json.JSONDecodeError, FileNotFoundError):
             self.data = {}
         
+        self._dirty = False
+        self._date_info: Dict[str, Tuple[datetime.date, str, int]] = {}
+        
         # Ensure settings exist with default values
         if 'settings' not in self.data:
             self.data['settings'] = {'lunch_break_minutes': 30}
         elif 'lunch_break_minutes' not in self.data['settings']:
             self.data['settings']['lunch_break_minutes'] = 30
+        
+        # Move day entries from the old flat layout under 'entries'
+        if 'entries' not in self.data:
+            self.data['entries'] = {
+                k: self.data.pop(k) for k in list(self.data)
+                if k != 'settings'
+            }
+        self._validate()
+        
+        # Rebuild weekly totals so hand edits to entries are never shadowed
+        self.rebuild_weekly_totals()
+        
+        self._lunch_minutes = self.data['settings']['lunch_break_minutes']
+        self._sorted_dates: List[str] = sorted(self.data['entries'])
+    
+    def _validate(self):
+        """Drop malformed entries so every entry can be read as a dict."""
+        for date_str, entry in list(self.data['entries'].items()):
+            if not isinstance(entry, dict):
+                del self.data['entries'][date_str]
     
     def save_data(self):
-        """Save work log data to file."""
-        with open(self.data_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        """Save work log data to file if anything changed since the last save."""
+        if not self._dirty:
+            return
+        
+        if orjson is not None:
+            payload = orjson.dumps(self.data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        else:
+            payload = json.dumps(self.data, indent=2, sort_keys=True).encode()
+        
+        # Write to a temporary file first so a crash never leaves a truncated log
+        tmp_file = self.data_file + ".tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.data_file)
+        except BaseException:
+            try:
+                os.remove(tmp_file)
+            except FileNotFoundError:
+                pass
+            raise
+        self._dirty = False
     
     def get_lunch_break_minutes(self) -> int:
         """Get the current lunch break duration in minutes."""
-        return self.data['settings']['lunch_break_minutes']
+        return self._lunch_minutes
     
-    def set_lunch_break_minutes(self, minutes: int):
+    def set_lunch_break_minutes(self, minutes: int, persist: bool = True):
         """Set the lunch break duration in minutes."""
-        self.data['settings']['lunch_break_minutes'] = minutes
-        self.save_data()
+        if self.data['settings']['lunch_break_minutes'] != minutes:
+            self.data['settings']['lunch_break_minutes'] = minutes
+            self._lunch_minutes = minutes
+            self._dirty = True
+        if persist:
+            self.save_data()
     
     def configure_lunch_break(self):
         """Allow user to configure lunch break duration."""
@@ -98,7 +192,8 @@ class WorkLogger:
             return
         
         if new_minutes is not None:
-            self.set_lunch_break_minutes(new_minutes)
+            # Saved once by recalculate_all_entries below
+            self.set_lunch_break_minutes(new_minutes, persist=False)
             new_hours = new_minutes // 60
             new_mins = new_minutes % 60
             
@@ -112,17 +207,23 @@ class WorkLogger:
     
     def recalculate_all_entries(self):
         """Recalculate hours worked for all entries with current lunch break setting."""
-        lunch_minutes = self.get_lunch_break_minutes()
+        lunch_minutes = self._lunch_minutes
         recalculated_count = 0
         
-        for date_str, entry in self.data.items():
-            if date_str == 'settings':
-                continue
-            
-            if isinstance(entry, dict) and 'start' in entry and 'end' in entry:
+        # Start/end times repeat a lot across days, so parse each string once
+        time_cache: Dict[str, datetime.time] = {}
+        
+        def parse_time(time_str: str) -> datetime.time:
+            if time_str not in time_cache:
+                time_cache[time_str] = datetime.time(*_parse_hhmm(time_str))
+            return time_cache[time_str]
+        
+        for date_str, entry in self.data['entries'].items():
+            if 'start' in entry and 'end' in entry:
                 try:
-                    start_datetime = datetime.datetime.strptime(f"{date_str} {entry['start']}", "%Y-%m-%d %H:%M")
-                    end_datetime = datetime.datetime.strptime(f"{date_str} {entry['end']}", "%Y-%m-%d %H:%M")
+                    date = self.get_date_info(date_str)[0]
+                    start_datetime = datetime.datetime.combine(date, parse_time(entry['start']))
+                    end_datetime = datetime.datetime.combine(date, parse_time(entry['end']))
                     
                     # Handle case where end time is next day
                     if end_datetime < start_datetime:
@@ -132,24 +233,37 @@ class WorkLogger:
                     worked_minutes = total_minutes - lunch_minutes
                     worked_hours = worked_minutes / 60
                     
-                    entry['hours_worked'] = round(worked_hours, 2)
-                    entry['total_minutes'] = int(worked_minutes)
+                    if (entry.get('hours_worked') != round(worked_hours, 2)
+                            or entry.get('total_minutes') != int(worked_minutes)):
+                        entry['hours_worked'] = round(worked_hours, 2)
+                        entry['total_minutes'] = int(worked_minutes)
+                        self._dirty = True
                     recalculated_count += 1
                     
                 except ValueError:
                     continue
         
         if recalculated_count > 0:
-            self.save_data()
+            self.rebuild_weekly_totals()
+        self.save_data()
+        if recalculated_count > 0:
             print(f"📊 Recalculated {recalculated_count} entries with new lunch break duration.")
     
     def clear_previous_entries(self):
         """Clear all previous entries but keep settings."""
         settings = self.data.get('settings', {'lunch_break_minutes': 30})
-        self.data = {'settings': settings}
+        self.data = {'settings': settings, 'entries': {}, '_weekly_minutes': {}}
+        self._sorted_dates = []
+        self._date_info = {}
+        self._dirty = True
         self.save_data()
         print("🗑️  Previous work log entries cleared for new week.")
     
+    def add_entry(self, date_str: str):
+        """Create an empty entry for a date, keeping the date list sorted."""
+        self.data['entries'][date_str] = {}
+        bisect.insort(self._sorted_dates, date_str)
+    
     def is_first_monday_input(self, target_date: datetime.date = None) -> bool:
         """Check if this is the first input on a Monday."""
         if target_date is None:
@@ -161,41 +275,80 @@ class WorkLogger:
         
         # Check if there are no entries for today yet
         date_str = target_date.strftime("%Y-%m-%d")
-        return date_str not in self.data or not self.data[date_str]
+        return date_str not in self.data['entries'] or not self.data['entries'][date_str]
     
     def get_week_start(self, date: datetime.date) -> datetime.date:
         """Get the start of the week (Monday) for a given date."""
         return date - datetime.timedelta(days=date.weekday())
     
+    def get_date_info(self, date_str: str) -> Tuple[datetime.date, str, int]:
+        """Return (date, week start string, weekday index) for a YYYY-MM-DD string, cached."""
+        info = self._date_info.get(date_str)
+        if info is None:
+            date = _parse_date(date_str)
+            weekday = date.weekday()
+            week_start = (date - datetime.timedelta(days=weekday)).strftime("%Y-%m-%d")
+            info = self._date_info[date_str] = (date, week_start, weekday)
+        return info
+    
+    def rebuild_weekly_totals(self):
+        """Recompute the stored weekly totals (in minutes) from all entries."""
+        weekly_minutes = {}
+        for date_str, entry in self.data['entries'].items():
+            try:
+                week_start = self.get_date_info(date_str)[1]
+            except ValueError:
+                continue
+            weekly_minutes[week_start] = weekly_minutes.get(week_start, 0) + entry.get('total_minutes', 0)
+        # Weeks without worked time read as 0, so don't store empty buckets
+        self.data['_weekly_minutes'] = {k: v for k, v in weekly_minutes.items() if v}
+    
+    def update_weekly_total(self, date_str: str, old_minutes: int):
+        """Apply a change in date_str's worked minutes (previously old_minutes) to its week's total."""
+        week_start = self.get_date_info(date_str)[1]
+        new_minutes = self.data['entries'].get(date_str, {}).get('total_minutes', 0)
+        weekly_minutes = self.data['_weekly_minutes']
+        total = weekly_minutes.get(week_start, 0) + new_minutes - old_minutes
+        if total:
+            weekly_minutes[week_start] = total
+        else:
+            weekly_minutes.pop(week_start, None)
+    
+    def _weekly_minutes(self, target_date: datetime.date = None) -> int:
+        """Return total minutes worked in the week containing target_date."""
+        if target_date is None:
+            target_date = datetime.date.today()
+        week_start = self.get_week_start(target_date).strftime("%Y-%m-%d")
+        return self.data['_weekly_minutes'].get(week_start, 0)
+    
+    def _weekly_total(self, target_date: datetime.date = None) -> float:
+        """Return total hours worked in the week containing target_date."""
+        return self._weekly_minutes(target_date) / 60
+    
     def get_weekly_hours(self, target_date: datetime.date = None) -> Tuple[float, List[str]]:
         """Calculate total hours worked this week and return list of dates."""
         if target_date is None:
             target_date = datetime.date.today()
         
         week_start = self.get_week_start(target_date)
-        total_hours = 0
+        total_hours = self._weekly_total(target_date)
         week_dates = []
         
         for i in range(7):
             date = week_start + datetime.timedelta(days=i)
-            date_str = date.strftime("%Y-%m-%d")
-            week_dates.append(date_str)
-            
-            if date_str in self.data and isinstance(self.data[date_str], dict):
-                entry = self.data[date_str]
-                hours = entry.get('hours_worked', 0)
-                total_hours += hours
+            week_dates.append(f"{date.year:04d}-{date.month:02d}-{date.day:02d}")
         
         return total_hours, week_dates
     
     def get_current_work_time(self):
         """Get current work time info if work has started today."""
-        today = datetime.date.today().strftime("%Y-%m-%d")
+        today_date = datetime.date.today()
+        today = today_date.strftime("%Y-%m-%d")
         
-        if today not in self.data or not isinstance(self.data[today], dict):
+        if today not in self.data['entries']:
             return None
         
-        entry = self.data[today]
+        entry = self.data['entries'][today]
         if 'start' not in entry:
             return None
         
@@ -204,7 +357,7 @@ class WorkLogger:
             return None
         
         try:
-            start_time = datetime.datetime.strptime(f"{today} {entry['start']}", "%Y-%m-%d %H:%M")
+            start_time = _combine(today_date, entry['start'])
             current_time = datetime.datetime.now()
             
             # Calculate elapsed time
@@ -223,12 +376,11 @@ class WorkLogger:
             work_hours = work_minutes // 60
             work_mins_remainder = work_minutes % 60
             
-            # Get weekly hours (excluding today's current session)
-            weekly_hours, _ = self.get_weekly_hours()
-            current_day_hours = work_minutes / 60
+            # Get weekly minutes (excluding today's current session)
+            weekly_minutes = self._weekly_minutes(today_date)
             
             # Calculate for daily 7-hour rule
-            target_total_minutes = 420 + lunch_minutes  # 7 hours + lunch break
+            target_total_minutes = TARGET_DAILY_MIN + lunch_minutes  # 7 hours + lunch break
             minutes_until_7h = target_total_minutes - total_minutes
             
             if minutes_until_7h > 0:
@@ -242,14 +394,13 @@ class WorkLogger:
                 mins_until_7h = 0
             
             # Calculate for weekly 35-hour rule - only if weekly hours > 27
-            remaining_weekly_hours = 35 - weekly_hours
-            remaining_weekly_minutes = remaining_weekly_hours * 60
+            remaining_weekly_minutes = TARGET_WEEKLY_MIN - weekly_minutes
             
             # How many more minutes needed today to reach 35h for the week
             minutes_needed_for_35h = remaining_weekly_minutes - work_minutes
             
             # Only calculate 35h time if weekly hours > 27
-            show_35h_target = weekly_hours > 27
+            show_35h_target = weekly_minutes > SHOW_WEEKLY_TARGET_MIN
             
             if show_35h_target and minutes_needed_for_35h > 0:
                 # Add lunch break if we haven't reached 4 hours yet
@@ -259,8 +410,8 @@ class WorkLogger:
                 total_minutes_for_35h = total_minutes + minutes_needed_for_35h
                 leave_time_35h = start_time + datetime.timedelta(minutes=total_minutes_for_35h)
                 time_to_leave_35h = leave_time_35h.strftime("%H:%M")
-                hours_until_35h = int(minutes_needed_for_35h) // 60
-                mins_until_35h = int(minutes_needed_for_35h) % 60
+                hours_until_35h = minutes_needed_for_35h // 60
+                mins_until_35h = minutes_needed_for_35h % 60
             else:
                 time_to_leave_35h = None
                 hours_until_35h = 0
@@ -273,9 +424,10 @@ class WorkLogger:
                 'work_hours': work_hours,
                 'work_minutes': work_mins_remainder,
                 'total_work_minutes': work_minutes,
-                'weekly_hours': weekly_hours,
-                'current_day_hours': current_day_hours,
-                'remaining_weekly_hours': remaining_weekly_hours,
+                # Hours are only converted to floats for display
+                'weekly_hours': weekly_minutes / 60,
+                'current_day_hours': work_minutes / 60,
+                'remaining_weekly_hours': remaining_weekly_minutes / 60,
                 'lunch_minutes': lunch_minutes,
                 # 7-hour rule
                 'time_to_leave_7h': time_to_leave_7h,
@@ -287,8 +439,8 @@ class WorkLogger:
                 'time_to_leave_35h': time_to_leave_35h,
                 'hours_until_35h': hours_until_35h,
                 'mins_until_35h': mins_until_35h,
-                'weekly_target_reached': remaining_weekly_hours <= current_day_hours,
-                'minutes_needed_for_35h': max(0, int(minutes_needed_for_35h))
+                'weekly_target_reached': remaining_weekly_minutes <= work_minutes,
+                'minutes_needed_for_35h': max(0, minutes_needed_for_35h)
             }
         except ValueError:
             return None
@@ -298,53 +450,50 @@ class WorkLogger:
         work_info = self.get_current_work_time()
         
         if work_info:
-            print(f"\n🕐 WORK SESSION ACTIVE")
-            print(f"Started: {work_info['start_time']}")
-            print(f"Elapsed: {work_info['elapsed_hours']}h {work_info['elapsed_minutes']}m")
+            lines: List[str] = [
+                "\n🕐 WORK SESSION ACTIVE",
+                f"Started: {work_info['start_time']}",
+                f"Elapsed: {work_info['elapsed_hours']}h {work_info['elapsed_minutes']}m",
+            ]
             
             if work_info['total_work_minutes'] > 0:
-                print(f"Work time: {work_info['work_hours']}h {work_info['work_minutes']}m", end="")
+                work_line = f"Work time: {work_info['work_hours']}h {work_info['work_minutes']}m"
                 lunch_minutes = work_info['lunch_minutes']
                 if lunch_minutes > 0:
+                    lunch_hours = lunch_minutes // 60
+                    lunch_mins = lunch_minutes % 60
+                    lunch = f"{lunch_hours}h {lunch_mins}m" if lunch_hours > 0 else f"{lunch_mins}m"
                     if work_info['total_work_minutes'] > 240:  # More than 4 hours
-                        lunch_hours = lunch_minutes // 60
-                        lunch_mins = lunch_minutes % 60
-                        if lunch_hours > 0:
-                            print(f" ({lunch_hours}h {lunch_mins}m lunch break deducted)")
-                        else:
-                            print(f" ({lunch_mins}m lunch break deducted)")
+                        work_line += f" ({lunch} lunch break deducted)"
                     else:
-                        lunch_hours = lunch_minutes // 60
-                        lunch_mins = lunch_minutes % 60
-                        if lunch_hours > 0:
-                            print(f" ({lunch_hours}h {lunch_mins}m lunch break will be deducted)")
-                        else:
-                            print(f" ({lunch_mins}m lunch break will be deducted)")
+                        work_line += f" ({lunch} lunch break will be deducted)"
                 else:
-                    print(" (no lunch break)")
+                    work_line += " (no lunch break)"
+                lines.append(work_line)
             
             # Show weekly progress
-            print(f"📅 Weekly hours: {work_info['weekly_hours']:.1f}/35h (remaining: {work_info['remaining_weekly_hours']:.1f}h)")
+            lines.append(f"📅 Weekly hours: {work_info['weekly_hours']:.1f}/35h (remaining: {work_info['remaining_weekly_hours']:.1f}h)")
             
             # Determine which rule applies
             if work_info['weekly_target_reached']:
-                print(f"🎯 WEEKLY TARGET REACHED! You've completed 35+ hours this week")
+                lines.append(f"🎯 WEEKLY TARGET REACHED! You've completed 35+ hours this week")
             elif work_info['daily_target_reached']:
-                print(f"🎯 DAILY TARGET REACHED! You've completed 7+ hours today")
+                lines.append(f"🎯 DAILY TARGET REACHED! You've completed 7+ hours today")
                 # Only show 35h target if weekly hours > 27
                 if work_info['show_35h_target'] and work_info['time_to_leave_35h']:
-                    print(f"📅 For 35h week: Leave at {work_info['time_to_leave_35h']} (in {work_info['hours_until_35h']:02d}:{work_info['mins_until_35h']:02d})")
+                    lines.append(f"📅 For 35h week: Leave at {work_info['time_to_leave_35h']} (in {work_info['hours_until_35h']:02d}:{work_info['mins_until_35h']:02d})")
             else:
                 # Show both targets
-                print(f"🎯 Daily (7h): Leave at {work_info['time_to_leave_7h']} (in {work_info['hours_until_7h']:02d}:{work_info['mins_until_7h']:02d})")
+                lines.append(f"🎯 Daily (7h): Leave at {work_info['time_to_leave_7h']} (in {work_info['hours_until_7h']:02d}:{work_info['mins_until_7h']:02d})")
                 # Only show 35h target if weekly hours > 27
                 if work_info['show_35h_target']:
                     if work_info['time_to_leave_35h']:
-                        print(f"📅 Weekly (35h): Leave at {work_info['time_to_leave_35h']} (in {work_info['hours_until_35h']:02d}:{work_info['mins_until_35h']:02d})")
+                        lines.append(f"📅 Weekly (35h): Leave at {work_info['time_to_leave_35h']} (in {work_info['hours_until_35h']:02d}:{work_info['mins_until_35h']:02d})")
                     else:
-                        print(f"📅 Weekly (35h): Target already reached this week!")
+                        lines.append(f"📅 Weekly (35h): Target already reached this week!")
             
-            print()
+            lines.append("")
+            print('\n'.join(lines))
     
     def log_start(self, time_str: Optional[str] = None):
         """Log work start time."""
@@ -353,23 +502,21 @@ class WorkLogger:
             self.clear_previous_entries()
         
         if time_str:
-            try:
-                start_time = datetime.datetime.strptime(time_str, "%H:%M")
-                start_time = start_time.replace(year=datetime.date.today().year,
-                                              month=datetime.date.today().month,
-                                              day=datetime.date.today().day)
-            except ValueError:
+            parsed = _valid_hhmm(time_str)
+            if parsed is None:
                 print("Invalid time format. Use HH:MM (24-hour format)")
                 return False
+            start_time = datetime.datetime.combine(datetime.date.today(), datetime.time(*parsed))
         else:
             start_time = datetime.datetime.now()
         
         date_str = start_time.strftime("%Y-%m-%d")
         
-        if date_str not in self.data:
-            self.data[date_str] = {}
+        if date_str not in self.data['entries']:
+            self.add_entry(date_str)
         
-        self.data[date_str]['start'] = start_time.strftime("%H:%M")
+        self.data['entries'][date_str]['start'] = start_time.strftime("%H:%M")
+        self._dirty = True
         self.save_data()
         
         print(f"Work start logged: {start_time.strftime('%Y-%m-%d %H:%M')}")
@@ -382,30 +529,29 @@ class WorkLogger:
             self.clear_previous_entries()
         
         if time_str:
-            try:
-                end_time = datetime.datetime.strptime(time_str, "%H:%M")
-                end_time = end_time.replace(year=datetime.date.today().year,
-                                          month=datetime.date.today().month,
-                                          day=datetime.date.today().day)
-            except ValueError:
+            parsed = _valid_hhmm(time_str)
+            if parsed is None:
                 print("Invalid time format. Use HH:MM (24-hour format)")
                 return False
+            end_time = datetime.datetime.combine(datetime.date.today(), datetime.time(*parsed))
         else:
             end_time = datetime.datetime.now()
         
         date_str = end_time.strftime("%Y-%m-%d")
         
-        if date_str not in self.data:
-            self.data[date_str] = {}
+        if date_str not in self.data['entries']:
+            self.add_entry(date_str)
         
-        if 'start' not in self.data[date_str]:
+        if 'start' not in self.data['entries'][date_str]:
             print(f"No start time found for {date_str}. Please log start time first.")
             return False
         
-        self.data[date_str]['end'] = end_time.strftime("%H:%M")
+        self.data['entries'][date_str]['end'] = end_time.strftime("%H:%M")
+        self._dirty = True
         
         # Calculate hours worked
-        start_datetime = datetime.datetime.strptime(f"{date_str} {self.data[date_str]['start']}", "%Y-%m-%d %H:%M")
+        start_hour, start_minute = _parse_hhmm(self.data['entries'][date_str]['start'])
+        start_datetime = end_time.replace(hour=start_hour, minute=start_minute, second=0, microsecond=0)
         end_datetime = end_time
         
         # Handle case where end time is next day
@@ -418,8 +564,10 @@ class WorkLogger:
         worked_minutes = total_minutes - lunch_minutes
         worked_hours = worked_minutes / 60
         
-        self.data[date_str]['hours_worked'] = round(worked_hours, 2)
-        self.data[date_str]['total_minutes'] = int(worked_minutes)
+        old_minutes = self.data['entries'][date_str].get('total_minutes', 0)
+        self.data['entries'][date_str]['hours_worked'] = round(worked_hours, 2)
+        self.data['entries'][date_str]['total_minutes'] = int(worked_minutes)
+        self.update_weekly_total(date_str, old_minutes)
         
         self.save_data()
         
@@ -437,7 +585,7 @@ class WorkLogger:
             print("(no lunch break deducted)")
         
         # Show weekly summary
-        weekly_hours, _ = self.get_weekly_hours()
+        weekly_hours = self._weekly_total()
         print(f"Weekly total: {weekly_hours:.2f}/35 hours")
         
         return True
@@ -445,8 +593,8 @@ class WorkLogger:
     def view_today(self):
         """View today's work log."""
         today = datetime.date.today().strftime("%Y-%m-%d")
-        if today in self.data and isinstance(self.data[today], dict):
-            entry = self.data[today]
+        if today in self.data['entries']:
+            entry = self.data['entries'][today]
             print(f"\n--- Work Log for {today} ---")
             print(f"Start: {entry.get('start', 'Not logged')}")
             print(f"End: {entry.get('end', 'Not logged')}")
@@ -454,7 +602,7 @@ class WorkLogger:
                 print(f"Hours worked: {entry['hours_worked']} hours")
             
             # Show weekly context
-            weekly_hours, _ = self.get_weekly_hours()
+            weekly_hours = self._weekly_total()
             print(f"Weekly total: {weekly_hours:.2f}/35 hours")
             print()
         else:
@@ -465,29 +613,24 @@ class WorkLogger:
         today = datetime.date.today()
         week_start = self.get_week_start(today)
         
-        print(f"\n--- Work Log for Week of {week_start.strftime('%Y-%m-%d')} ---")
-        total_hours = 0
+        out: List[str] = [f"\n--- Work Log for Week of {week_start.strftime('%Y-%m-%d')} ---"]
+        total_hours, week_dates = self.get_weekly_hours(today)
         
-        for i in range(7):
-            date = week_start + datetime.timedelta(days=i)
-            date_str = date.strftime("%Y-%m-%d")
-            day_name = date.strftime("%A")
-            
-            if date_str in self.data and isinstance(self.data[date_str], dict):
-                entry = self.data[date_str]
+        for day_name, date_str in zip(_WEEKDAYS, week_dates):
+            if date_str in self.data['entries']:
+                entry = self.data['entries'][date_str]
                 hours = entry.get('hours_worked', 0)
-                total_hours += hours
                 status = "✓" if hours > 0 else "○"
-                print(f"{status} {day_name} ({date_str}): {hours} hours")
+                out.append(f"{status} {day_name} ({date_str}): {hours} hours")
             else:
-                print(f"○ {day_name} ({date_str}): No log")
+                out.append(f"○ {day_name} ({date_str}): No log")
         
-        print(f"\nTotal hours this week: {total_hours:.2f}/35 hours")
+        out.append(f"\nTotal hours this week: {total_hours:.2f}/35 hours")
         remaining = 35 - total_hours
         if remaining > 0:
-            print(f"Remaining to reach 35h: {remaining:.2f} hours")
+            out.append(f"Remaining to reach 35h: {remaining:.2f} hours")
         else:
-            print("✅ Weekly target of 35 hours reached!")
+            out.append("✅ Weekly target of 35 hours reached!")
         
         # Show current lunch break setting
         lunch_minutes = self.get_lunch_break_minutes()
@@ -495,51 +638,51 @@ class WorkLogger:
             lunch_hours = lunch_minutes // 60
             lunch_mins = lunch_minutes % 60
             if lunch_hours > 0:
-                print(f"Lunch break setting: {lunch_hours}h {lunch_mins}m")
+                out.append(f"Lunch break setting: {lunch_hours}h {lunch_mins}m")
             else:
-                print(f"Lunch break setting: {lunch_mins} minutes")
+                out.append(f"Lunch break setting: {lunch_mins} minutes")
         else:
-            print("Lunch break: Disabled")
-        print()
+            out.append("Lunch break: Disabled")
+        out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
     
     def view_all(self):
         """View all work logs."""
-        work_entries = {k: v for k, v in self.data.items() if k != 'settings' and isinstance(v, dict)}
+        work_entries = self.data['entries']
         
         if not work_entries:
             print("No work logs found.")
             return
         
-        print("\n--- All Work Logs ---")
+        out: List[str] = ["\n--- All Work Logs ---"]
         total_hours = 0
         current_week_start = None
         week_total = 0
         
-        for date in sorted(work_entries.keys()):
+        for date in self._sorted_dates:
             entry = work_entries[date]
             hours = entry.get('hours_worked', 0)
             total_hours += hours
             
             # Check if we're in a new week
-            date_obj = datetime.datetime.strptime(date, "%Y-%m-%d").date()
-            week_start = self.get_week_start(date_obj)
+            week_start = self.get_date_info(date)[1]
             
             if current_week_start != week_start:
                 if current_week_start is not None:
-                    print(f"    Week total: {week_total:.2f}/35 hours")
+                    out.append(f"    Week total: {week_total:.2f}/35 hours")
                 current_week_start = week_start
                 week_total = 0
-                print(f"\n  Week of {week_start.strftime('%Y-%m-%d')}:")
+                out.append(f"\n  Week of {week_start}:")
             
             week_total += hours
             start = entry.get('start', 'N/A')
             end = entry.get('end', 'N/A')
-            print(f"    {date}: {start} - {end} ({hours} hours)")
+            out.append(f"    {date}: {start} - {end} ({hours} hours)")
         
         if current_week_start is not None:
-            print(f"    Week total: {week_total:.2f}/35 hours")
+            out.append(f"    Week total: {week_total:.2f}/35 hours")
         
-        print(f"\nTotal hours logged: {total_hours:.2f} hours")
+        out.append(f"\nTotal hours logged: {total_hours:.2f} hours")
         
         # Show current lunch break setting
         lunch_minutes = self.get_lunch_break_minutes()
@@ -547,16 +690,17 @@ class WorkLogger:
             lunch_hours = lunch_minutes // 60
             lunch_mins = lunch_minutes % 60
             if lunch_hours > 0:
-                print(f"Current lunch break setting: {lunch_hours}h {lunch_mins}m")
+                out.append(f"Current lunch break setting: {lunch_hours}h {lunch_mins}m")
             else:
-                print(f"Current lunch break setting: {lunch_mins} minutes")
+                out.append(f"Current lunch break setting: {lunch_mins} minutes")
         else:
-            print("Current lunch break setting: Disabled")
-        print()
+            out.append("Current lunch break setting: Disabled")
+        out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
     
     def edit_past_day(self):
         """Edit work times for a past day."""
-        work_entries = {k: v for k, v in self.data.items() if k != 'settings' and isinstance(v, dict)}
+        work_entries = self.data['entries']
         
         if not work_entries:
             print("No work logs found to edit.")
@@ -564,7 +708,7 @@ class WorkLogger:
         
         print("\n--- Edit Past Day ---")
         print("Available dates:")
-        for date in sorted(work_entries.keys()):
+        for date in self._sorted_dates:
             entry = work_entries[date]
             start = entry.get('start', 'N/A')
             end = entry.get('end', 'N/A')
@@ -582,12 +726,15 @@ class WorkLogger:
             print("Invalid date format. Use YYYY-MM-DD")
             return
         
+        changed = False
+        
         # Create entry if it doesn't exist
-        if date_input not in self.data:
-            self.data[date_input] = {}
+        if date_input not in self.data['entries']:
+            self.add_entry(date_input)
+            changed = True
             print(f"Created new entry for {date_input}")
         
-        current_entry = self.data[date_input]
+        current_entry = self.data['entries'][date_input]
         current_start = current_entry.get('start', 'Not set')
         current_end = current_entry.get('end', 'Not set')
         
@@ -598,30 +745,35 @@ class WorkLogger:
         # Edit start time
         new_start = input(f"Enter new start time (HH:MM) or press Enter to keep '{current_start}': ").strip()
         if new_start:
-            try:
-                datetime.datetime.strptime(new_start, "%H:%M")
-                self.data[date_input]['start'] = new_start
+            parsed = _valid_hhmm(new_start)
+            if parsed is not None:
+                new_start = f"{parsed[0]:02d}:{parsed[1]:02d}"
+                self.data['entries'][date_input]['start'] = new_start
+                changed = True
                 print(f"Start time updated to {new_start}")
-            except ValueError:
+            else:
                 print("Invalid time format. Start time not changed.")
         
         # Edit end time
         new_end = input(f"Enter new end time (HH:MM) or press Enter to keep '{current_end}': ").strip()
         if new_end:
-            try:
-                datetime.datetime.strptime(new_end, "%H:%M")
-                self.data[date_input]['end'] = new_end
+            parsed = _valid_hhmm(new_end)
+            if parsed is not None:
+                new_end = f"{parsed[0]:02d}:{parsed[1]:02d}"
+                self.data['entries'][date_input]['end'] = new_end
+                changed = True
                 print(f"End time updated to {new_end}")
-            except ValueError:
+            else:
                 print("Invalid time format. End time not changed.")
         
-        # Recalculate hours if both start and end are set
-        if 'start' in self.data[date_input] and 'end' in self.data[date_input]:
-            start_str = self.data[date_input]['start']
-            end_str = self.data[date_input]['end']
+        # Recalculate hours if a time changed and both start and end are set
+        if changed and 'start' in self.data['entries'][date_input] and 'end' in self.data['entries'][date_input]:
+            start_str = self.data['entries'][date_input]['start']
+            end_str = self.data['entries'][date_input]['end']
             
-            start_datetime = datetime.datetime.strptime(f"{date_input} {start_str}", "%Y-%m-%d %H:%M")
-            end_datetime = datetime.datetime.strptime(f"{date_input} {end_str}", "%Y-%m-%d %H:%M")
+            start_datetime = _combine(self.get_date_info(date_input)[0], start_str)
+            end_hour, end_minute = _parse_hhmm(end_str)
+            end_datetime = start_datetime.replace(hour=end_hour, minute=end_minute)
             
             # Handle case where end time is next day
             if end_datetime < start_datetime:
@@ -633,8 +785,10 @@ class WorkLogger:
             worked_minutes = total_minutes - lunch_minutes
             worked_hours = worked_minutes / 60
             
-            self.data[date_input]['hours_worked'] = round(worked_hours, 2)
-            self.data[date_input]['total_minutes'] = int(worked_minutes)
+            old_minutes = self.data['entries'][date_input].get('total_minutes', 0)
+            self.data['entries'][date_input]['hours_worked'] = round(worked_hours, 2)
+            self.data['entries'][date_input]['total_minutes'] = int(worked_minutes)
+            self.update_weekly_total(date_input, old_minutes)
             
             print(f"Hours worked recalculated: {worked_hours:.2f} hours ({int(worked_minutes)} minutes)")
             
@@ -648,12 +802,16 @@ class WorkLogger:
             else:
                 print("(no lunch break deducted)")
         
-        self.save_data()
-        print(f"\nChanges saved for {date_input}")
+        if changed:
+            self._dirty = True
+            self.save_data()
+            print(f"\nChanges saved for {date_input}")
+        else:
+            print(f"\nNo changes made for {date_input}")
     
     def delete_day(self):
         """Delete a work log entry for a specific day."""
-        work_entries = {k: v for k, v in self.data.items() if k != 'settings' and isinstance(v, dict)}
+        work_entries = self.data['entries']
         
         if not work_entries:
             print("No work logs found to delete.")
@@ -661,7 +819,7 @@ class WorkLogger:
         
         print("\n--- Delete Day ---")
         print("Available dates:")
-        for date in sorted(work_entries.keys()):
+        for date in self._sorted_dates:
             entry = work_entries[date]
             start = entry.get('start', 'N/A')
             end = entry.get('end', 'N/A')
@@ -672,14 +830,20 @@ class WorkLogger:
         if not date_input:
             return
         
-        if date_input not in self.data or date_input == 'settings':
+        if date_input not in self.data['entries']:
             print(f"No entry found for {date_input}")
             return
         
         # Confirm deletion
         confirm = input(f"Are you sure you want to delete the entry for {date_input}? (y/N): ").strip().lower()
         if confirm in ['y', 'yes']:
-            del self.data[date_input]
+            old_minutes = self.data['entries'].pop(date_input).get('total_minutes', 0)
+            self._sorted_dates.remove(date_input)
+            try:
+                self.update_weekly_total(date_input, old_minutes)
+            except ValueError:
+                pass
+            self._dirty = True
             self.save_data()
             print(f"Entry for {date_input} deleted.")
         else: